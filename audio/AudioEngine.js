@@ -9,6 +9,7 @@ export class AudioEngine {
     this.analyser = null;
     this.microphone = null;
     this.dataArray = null;
+    this.waveformArray = null;
     this.bufferLength = 0;
 
     // Frequency band indices (will be calculated based on FFT size)
@@ -52,6 +53,7 @@ export class AudioEngine {
 
       this.bufferLength = this.analyser.frequencyBinCount;
       this.dataArray = new Uint8Array(this.bufferLength);
+      this.waveformArray = new Uint8Array(this.analyser.fftSize); // Reused every frame
 
       // Connect microphone to analyser
       this.microphone = this.audioContext.createMediaStreamSource(stream);
@@ -123,20 +125,29 @@ export class AudioEngine {
     this.analyser.getByteFrequencyData(this.dataArray);
 
     // Get time-domain data for waveform visualization
-    const waveformData = new Uint8Array(this.analyser.fftSize);
-    this.analyser.getByteTimeDomainData(waveformData);
-
-    // Calculate energy for each frequency band
-    const subBassEnergy = this._calculateBandEnergy(this.subBassRange.start, this.subBassRange.end);
-    const bassEnergy = this._calculateBandEnergy(this.bassRange.start, this.bassRange.end);
-    const midEnergy = this._calculateBandEnergy(this.midRange.start, this.midRange.end);
-    const highEnergy = this._calculateBandEnergy(this.highRange.start, this.highRange.end);
-
-    // Calculate total energy (weighted average)
-    const totalEnergy = (subBassEnergy + bassEnergy + midEnergy + highEnergy) / 4;
+    this.analyser.getByteTimeDomainData(this.waveformArray);
+
+    // Sum the spectrum once: the bands are contiguous, so the per-band sums
+    // also give the overall loudness without a second pass over every bin
+    const subBassSum = this._sumBins(this.subBassRange.start, this.subBassRange.end);
+    const bassSum = this._sumBins(this.bassRange.start, this.bassRange.end);
+    const midSum = this._sumBins(this.midRange.start, this.midRange.end);
+    const highSum = this._sumBins(this.highRange.start, this.highRange.end);
+    const outsideSum =
+      this._sumBins(0, this.subBassRange.start) +
+      this._sumBins(this.highRange.end, this.bufferLength);
+
+    // Average energy for each frequency band
+    const subBassEnergy = this._averageOf(subBassSum, this.subBassRange);
+    const bassEnergy = this._averageOf(bassSum, this.bassRange);
+    const midEnergy = this._averageOf(midSum, this.midRange);
+    const highEnergy = this._averageOf(highSum, this.highRange);
 
     // Calculate overall loudness (across entire spectrum)
-    const loudness = this._calculateBandEnergy(0, this.bufferLength);
+    const loudness =
+      this.bufferLength > 0
+        ? (subBassSum + bassSum + midSum + highSum + outsideSum) / this.bufferLength
+        : 0;
 
     // Update normalization values
     this._updateNormalization(subBassEnergy, bassEnergy, midEnergy, highEnergy);
@@ -157,22 +168,29 @@ export class AudioEngine {
       totalEnergy: (normalizedSubBass + normalizedBass + normalizedMid + normalizedHigh) / 4,
       loudness: normalizedLoudness,
       spectrum: this.dataArray, // Raw spectrum for advanced use
-      waveform: waveformData, // Time-domain waveform data for oscilloscope modes
+      waveform: this.waveformArray, // Time-domain waveform data for oscilloscope modes
     };
   }
 
   /**
-   * Calculate average energy in a frequency band
+   * Sum raw spectrum values in a bin range
    */
-  _calculateBandEnergy(startBin, endBin) {
+  _sumBins(startBin, endBin) {
+    const data = this.dataArray;
     let sum = 0;
-    let count = 0;
 
     for (let i = startBin; i < endBin; i++) {
-      sum += this.dataArray[i];
-      count++;
+      sum += data[i];
     }
 
+    return sum;
+  }
+
+  /**
+   * Convert a band sum into its average energy
+   */
+  _averageOf(sum, range) {
+    const count = range.end - range.start;
     return count > 0 ? sum / count : 0;
   }
 
@@ -180,8 +198,6 @@ export class AudioEngine {
    * Update normalization values using exponential moving average
    */
   _updateNormalization(subBass, bass, mid, high) {
-    const alpha = 0.05; // Smoothing factor
-
     // Update max values with decay
     this.maxSubBass = Math.max(subBass, this.maxSubBass * 0.995);
     this.maxBass = Math.max(bass, this.maxBass * 0.995);
@@ -209,14 +225,21 @@ export class AudioEngine {
    * Cleanup resources
    */
   destroy() {
+    // Safe to call more than once: references are dropped after release
     if (this.microphone) {
       this.microphone.disconnect();
+      this.microphone = null;
     }
 
     if (this.audioContext) {
-      this.audioContext.close();
+      const closing = this.audioContext.close();
+      if (closing) {
+        closing.catch(() => {}); // Context may already be closed
+      }
+      this.audioContext = null;
     }
 
+    this.analyser = null;
     this.isActive = false;
     console.log('🔇 Audio engine destroyed');
   }
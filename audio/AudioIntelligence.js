@@ -148,11 +148,9 @@ export class AudioIntelligence {
     }
 
     // Calculate trend (is energy increasing?)
-    const firstHalf = this.energyTrend.slice(0, this.trendSize / 2);
-    const secondHalf = this.energyTrend.slice(this.trendSize / 2);
-
-    const avgFirst = firstHalf.reduce((a, b) => a + b, 0) / firstHalf.length;
-    const avgSecond = secondHalf.reduce((a, b) => a + b, 0) / secondHalf.length;
+    const half = this.trendSize / 2;
+    const avgFirst = this._averageRange(this.energyTrend, 0, half);
+    const avgSecond = this._averageRange(this.energyTrend, half, this.energyTrend.length);
 
     const growthRate = (avgSecond - avgFirst) / (avgFirst + 0.01); // Prevent division by zero
 
@@ -160,6 +158,31 @@ export class AudioIntelligence {
     return growthRate > this.climaxThreshold && totalEnergy > 0.6;
   }
 
+  /**
+   * Average a slice of a history buffer without copying it
+   */
+  _averageRange(history, start, end) {
+    let sum = 0;
+    for (let i = start; i < end; i++) {
+      sum += history[i];
+    }
+    return sum / (end - start);
+  }
+
+  /**
+   * Check the newest `count` history entries for a value above `threshold`,
+   * scanning newest-first and stopping at the first match
+   */
+  _hasRecentValueAbove(history, count, threshold) {
+    const stop = Math.max(0, history.length - count);
+    for (let i = history.length - 1; i >= stop; i--) {
+      if (history[i] > threshold) {
+        return true;
+      }
+    }
+    return false;
+  }
+
   /**
    * Set silence detection threshold
    */
@@ -191,8 +214,9 @@ export class AudioIntelligence {
     }
 
     // Calculate recent average and current trend
-    const recentAvg = this.energyHistory.slice(-10).reduce((a, b) => a + b, 0) / 10;
-    const olderAvg = this.energyHistory.slice(0, 10).reduce((a, b) => a + b, 0) / 10;
+    const length = this.energyHistory.length;
+    const recentAvg = this._averageRange(this.energyHistory, length - 10, length);
+    const olderAvg = this._averageRange(this.energyHistory, 0, 10);
 
     // Check if we had high energy recently
     const hadHighEnergy = olderAvg > 0.6;
@@ -225,9 +249,7 @@ export class AudioIntelligence {
     }
 
     // Calculate baseline (average of older samples)
-    const baseline =
-      this.highFreqHistory.slice(0, -3).reduce((a, b) => a + b, 0) /
-      (this.highFreqHistory.length - 3);
+    const baseline = this._averageRange(this.highFreqHistory, 0, this.highFreqHistory.length - 3);
 
     // Check if current energy is significantly higher than baseline
     const spike = highEnergy - baseline;
@@ -258,8 +280,7 @@ export class AudioIntelligence {
     // PORTAL: Triggered by beat drop (handled separately, but check here too)
     else if (audioData.totalEnergy < 0.2 && this.energyHistory.length > 0) {
       // Check if we just had high energy
-      const recentHigh = this.energyHistory.slice(-20).some((e) => e > 0.6);
-      if (recentHigh) {
+      if (this._hasRecentValueAbove(this.energyHistory, 20, 0.6)) {
         targetState = 'PORTAL';
       }
     }
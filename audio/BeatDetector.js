@@ -12,6 +12,7 @@ export class BeatDetector {
     this.cooldownDuration = 15; // Minimum frames between beats (~250ms at 60fps)
     this.lastBeatTime = 0;
     this.beatConfidence = 0;
+    this.adaptiveThreshold = 0; // Last computed threshold (avg + sensitivity * stdDev)
 
     // Transient detection
     this.lastEnergy = 0;
@@ -72,23 +73,31 @@ export class BeatDetector {
       };
     }
 
-    // Calculate average energy
-    const avgEnergy = this.energyHistory.reduce((a, b) => a + b, 0) / this.energyHistory.length;
+    // Cheap checks first: a beat needs cooldown to be over and a minimum
+    // absolute energy, so the history statistics are only needed otherwise
+    const canBeat = this.cooldownFrames === 0 && currentEnergy > 0.3;
 
-    // Calculate variance for adaptive threshold
-    const variance =
-      this.energyHistory.reduce((sum, val) => {
-        return sum + Math.pow(val - avgEnergy, 2);
-      }, 0) / this.energyHistory.length;
+    if (canBeat) {
+      // Calculate average energy
+      const avgEnergy = this.energyHistory.reduce((a, b) => a + b, 0) / this.energyHistory.length;
 
-    const stdDev = Math.sqrt(variance);
+      // Calculate variance for adaptive threshold
+      const variance =
+        this.energyHistory.reduce((sum, val) => {
+          const deviation = val - avgEnergy;
+          return sum + deviation * deviation;
+        }, 0) / this.energyHistory.length;
 
-    // Adaptive threshold: average + (threshold * std deviation)
-    const adaptiveThreshold = avgEnergy + this.threshold * stdDev * 2;
+      const stdDev = Math.sqrt(variance);
+
+      // Adaptive threshold: average + (threshold * std deviation)
+      this.adaptiveThreshold = avgEnergy + this.threshold * stdDev * 2;
+    }
+
+    const adaptiveThreshold = this.adaptiveThreshold;
 
     // Detect beat if current energy exceeds threshold and not in cooldown
-    const isBeat =
-      currentEnergy > adaptiveThreshold && this.cooldownFrames === 0 && currentEnergy > 0.3; // Minimum absolute energy
+    const isBeat = canBeat && currentEnergy > adaptiveThreshold;
 
     let beatStrength = 0;
 
@@ -166,12 +175,25 @@ export class BeatDetector {
    */
   getRecentPeaks() {
     return {
-      bass: Math.max(...this.peakHistory.bass, 0),
-      mid: Math.max(...this.peakHistory.mid, 0),
-      high: Math.max(...this.peakHistory.high, 0),
+      bass: this._maxOf(this.peakHistory.bass),
+      mid: this._maxOf(this.peakHistory.mid),
+      high: this._maxOf(this.peakHistory.high),
     };
   }
 
+  /**
+   * Largest value in a history array (0 if empty), without spreading it into arguments
+   */
+  _maxOf(values) {
+    let max = 0;
+    for (let i = 0; i < values.length; i++) {
+      if (values[i] > max) {
+        max = values[i];
+      }
+    }
+    return max;
+  }
+
   /**
    * Get smoothed energy values
    */
@@ -190,5 +212,6 @@ export class BeatDetector {
     this.energyHistory = [];
     this.cooldownFrames = 0;
     this.beatConfidence = 0;
+    this.adaptiveThreshold = 0;
   }
 }
@@ -81,7 +81,7 @@ export class NetworkManager {
 
       const cellX = Math.floor(node.x / this.gridSize);
       const cellY = Math.floor(node.y / this.gridSize);
-      const key = `${cellX},${cellY}`;
+      const key = this._cellKey(cellX, cellY);
 
       if (!this.grid.has(key)) {
         this.grid.set(key, []);
@@ -90,6 +90,14 @@ export class NetworkManager {
     }
   }
 
+  /**
+   * Pack grid cell coordinates into a numeric Map key
+   * (avoids building a template string per lookup)
+   */
+  _cellKey(cellX, cellY) {
+    return (cellX + 0x8000) * 0x10000 + (cellY + 0x8000);
+  }
+
   /**
    * Get neighboring nodes using spatial grid
    */
@@ -101,9 +109,11 @@ export class NetworkManager {
     // Check current cell and adjacent cells
     for (let dx = -1; dx <= 1; dx++) {
       for (let dy = -1; dy <= 1; dy++) {
-        const key = `${cellX + dx},${cellY + dy}`;
-        if (this.grid.has(key)) {
-          neighbors.push(...this.grid.get(key));
+        const cell = this.grid.get(this._cellKey(cellX + dx, cellY + dy));
+        if (cell) {
+          for (let i = 0; i < cell.length; i++) {
+            neighbors.push(cell[i]);
+          }
         }
       }
     }
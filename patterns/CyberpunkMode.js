@@ -271,8 +271,6 @@ export class CyberpunkMode extends PatternBase {
    * Handle beat drop event
    */
   _onBeatDrop(audioData) {
-    console.log('💥 Beat drop detected!', audioData.beatDropIntensity);
-
     // Trigger glitch effect
     if (this.glitchSystem) {
       this.glitchSystem.triggerGlitch(audioData.beatDropIntensity);
@@ -384,6 +384,9 @@ export class ParticleEnergy extends PatternBase {
       this.vortexDirection *= -1;
     }
 
+    // Sample the clock once per frame rather than once per particle
+    const time = Date.now() * 0.002;
+
     for (const particle of this.particles) {
       const dx = particle.x - centerX;
       const dy = particle.y - centerY;
@@ -397,7 +400,6 @@ export class ParticleEnergy extends PatternBase {
       const newAngle = angle + rotationSpeed;
 
       // Radial pulsing based on highs
-      const time = Date.now() * 0.002;
       const radialPulse = Math.sin(time + particle.hue) * highValue * 15;
       const targetRadius = distance * spiralStrength + radialPulse;
 
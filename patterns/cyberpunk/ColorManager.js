@@ -63,6 +63,9 @@ export class ColorManager {
     ];
     this.currentPaletteIndex = 0;
 
+    // Last preset name known to be in localStorage (skips redundant writes)
+    this.savedPreset = null;
+
     // Load saved preset if exists
     this._loadSavedPreset();
   }
@@ -249,8 +252,13 @@ export class ColorManager {
    * Save preset to localStorage
    */
   _savePreset(presetName) {
+    if (presetName === this.savedPreset) {
+      return;
+    }
+
     try {
       localStorage.setItem('cyberpunk_color_preset', presetName);
+      this.savedPreset = presetName;
     } catch (error) {
       // localStorage might not be available
     }
@@ -262,6 +270,7 @@ export class ColorManager {
   _loadSavedPreset() {
     try {
       const saved = localStorage.getItem('cyberpunk_color_preset');
+      this.savedPreset = saved;
       if (saved && this.presets[saved]) {
         this.loadPreset(saved);
       }
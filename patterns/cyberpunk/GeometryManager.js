@@ -194,6 +194,9 @@ export class GeometryManager {
    * Update rotating hexagons
    */
   updateHexagons(audioData, stateVisuals) {
+    // Sample the clock once per frame rather than once per hexagon
+    const time = Date.now() * 0.001;
+
     for (const hexagon of this.hexagons) {
       // Stepped rotation (not smooth)
       const rotationStep = hexagon.userData.rotationSpeed * stateVisuals.rotationSpeed;
@@ -205,7 +208,7 @@ export class GeometryManager {
       hexagon.scale.set(scale, scale, 1);
 
       // Mid-driven Z oscillation
-      const zOffset = Math.sin(Date.now() * 0.001 + hexagon.userData.index) * audioData.mids * 2;
+      const zOffset = Math.sin(time + hexagon.userData.index) * audioData.mids * 2;
       hexagon.position.z = -10 - hexagon.userData.index * this.config.hexagons.spacing + zOffset;
     }
   }
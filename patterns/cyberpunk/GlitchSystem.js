@@ -140,8 +140,6 @@ export class GlitchSystem {
     this.glitchIntensity = Math.max(this.glitchIntensity, intensity);
     this.glitchPass.enabled = true;
     this._updateUniforms();
-
-    console.log(`📺 Glitch triggered: ${intensity.toFixed(2)}`);
   }
 
   /**
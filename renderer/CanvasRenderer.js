@@ -51,8 +51,13 @@ export class CanvasRenderer {
    * Render all edges
    */
   renderEdges(edges, audioData) {
+    const ctx = this.ctx;
+    const colorSystem = this.colorSystem;
+
     // Get dominant color
-    const color = this.colorSystem.getColorForFrequency(audioData);
+    const color = colorSystem.getColorForFrequency(audioData);
+
+    ctx.lineCap = 'round';
 
     for (const edge of edges) {
       if (!edge.active) {
@@ -62,15 +67,14 @@ export class CanvasRenderer {
       const { nodeA, nodeB } = edge;
 
       // Set line style
-      this.ctx.strokeStyle = this.colorSystem.rgbaToString(color, edge.opacity);
-      this.ctx.lineWidth = edge.thickness;
-      this.ctx.lineCap = 'round';
+      ctx.strokeStyle = colorSystem.rgbaToString(color, edge.opacity);
+      ctx.lineWidth = edge.thickness;
 
       // Draw straight line (no curves!)
-      this.ctx.beginPath();
-      this.ctx.moveTo(nodeA.x, nodeA.y);
-      this.ctx.lineTo(nodeB.x, nodeB.y);
-      this.ctx.stroke();
+      ctx.beginPath();
+      ctx.moveTo(nodeA.x, nodeA.y);
+      ctx.lineTo(nodeB.x, nodeB.y);
+      ctx.stroke();
     }
   }
 
@@ -78,8 +82,17 @@ export class CanvasRenderer {
    * Render all nodes with glow effects
    */
   renderNodes(nodes, audioData) {
+    const ctx = this.ctx;
+
     // Get dominant color
     const color = this.colorSystem.getColorForFrequency(audioData);
+    const fillColor = this.colorSystem.rgbToString(color);
+
+    ctx.fillStyle = fillColor;
+    ctx.shadowColor = fillColor;
+
+    // Batch consecutive nodes that share a glow into one path and one fill
+    let batchGlow = null;
 
     for (const node of nodes) {
       if (!node.active) {
@@ -88,23 +101,28 @@ export class CanvasRenderer {
 
       const { x, y, size, glow } = node;
 
-      // Draw glow effect (if glow > 0)
-      if (glow > 0) {
-        this.ctx.shadowBlur = glow;
-        this.ctx.shadowColor = this.colorSystem.rgbToString(color);
-      } else {
-        this.ctx.shadowBlur = 0;
+      if (glow !== batchGlow) {
+        if (batchGlow !== null) {
+          ctx.fill();
+        }
+
+        // Draw glow effect (if glow > 0)
+        ctx.shadowBlur = glow > 0 ? glow : 0;
+        ctx.beginPath();
+        batchGlow = glow;
       }
 
-      // Draw node as solid circle
-      this.ctx.fillStyle = this.colorSystem.rgbToString(color);
-      this.ctx.beginPath();
-      this.ctx.arc(x, y, size, 0, Math.PI * 2);
-      this.ctx.fill();
+      // Draw node as solid circle (moveTo keeps circles from being joined)
+      ctx.moveTo(x + size, y);
+      ctx.arc(x, y, size, 0, Math.PI * 2);
+    }
 
-      // Reset shadow
-      this.ctx.shadowBlur = 0;
+    if (batchGlow !== null) {
+      ctx.fill();
     }
+
+    // Reset shadow
+    ctx.shadowBlur = 0;
   }
 
   /**
@@ -113,10 +131,14 @@ export class CanvasRenderer {
   renderStereo(network, leftEnergy, rightEnergy) {
     this.clear();
 
-    const colors = this.colorSystem.getStereoColors(leftEnergy, rightEnergy);
+    const ctx = this.ctx;
+    const colorSystem = this.colorSystem;
+    const colors = colorSystem.getStereoColors(leftEnergy, rightEnergy);
     const centerX = this.canvas.width / 2;
 
     // Render edges
+    ctx.lineCap = 'round';
+
     for (const edge of network.edges) {
       if (!edge.active) {
         continue;
@@ -128,14 +150,13 @@ export class CanvasRenderer {
       // Choose color based on edge position
       const color = midX < centerX ? colors.left : colors.right;
 
-      this.ctx.strokeStyle = this.colorSystem.rgbaToString(color, edge.opacity);
-      this.ctx.lineWidth = edge.thickness;
-      this.ctx.lineCap = 'round';
+      ctx.strokeStyle = colorSystem.rgbaToString(color, edge.opacity);
+      ctx.lineWidth = edge.thickness;
 
-      this.ctx.beginPath();
-      this.ctx.moveTo(nodeA.x, nodeA.y);
-      this.ctx.lineTo(nodeB.x, nodeB.y);
-      this.ctx.stroke();
+      ctx.beginPath();
+      ctx.moveTo(nodeA.x, nodeA.y);
+      ctx.lineTo(nodeB.x, nodeB.y);
+      ctx.stroke();
     }
 
     // Render nodes
@@ -146,20 +167,21 @@ export class CanvasRenderer {
 
       const { x, y, size, glow } = node;
       const color = x < centerX ? colors.left : colors.right;
+      const fillColor = colorSystem.rgbToString(color);
 
       if (glow > 0) {
-        this.ctx.shadowBlur = glow;
-        this.ctx.shadowColor = this.colorSystem.rgbToString(color);
+        ctx.shadowBlur = glow;
+        ctx.shadowColor = fillColor;
       } else {
-        this.ctx.shadowBlur = 0;
+        ctx.shadowBlur = 0;
       }
 
-      this.ctx.fillStyle = this.colorSystem.rgbToString(color);
-      this.ctx.beginPath();
-      this.ctx.arc(x, y, size, 0, Math.PI * 2);
-      this.ctx.fill();
+      ctx.fillStyle = fillColor;
+      ctx.beginPath();
+      ctx.arc(x, y, size, 0, Math.PI * 2);
+      ctx.fill();
 
-      this.ctx.shadowBlur = 0;
+      ctx.shadowBlur = 0;
     }
   }
 
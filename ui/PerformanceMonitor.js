@@ -6,6 +6,7 @@
 export class PerformanceMonitor {
   constructor() {
     this.frameTimes = [];
+    this.frameTimeSum = 0; // Running total of frameTimes (avoids re-summing each frame)
     this.maxFrames = 60;
     this.lastTime = performance.now();
     this.fps = 0;
@@ -28,12 +29,13 @@ export class PerformanceMonitor {
 
     // Track frame times
     this.frameTimes.push(delta);
+    this.frameTimeSum += delta;
     if (this.frameTimes.length > this.maxFrames) {
-      this.frameTimes.shift();
+      this.frameTimeSum -= this.frameTimes.shift();
     }
 
     // Calculate average FPS
-    const avgFrameTime = this.frameTimes.reduce((a, b) => a + b, 0) / this.frameTimes.length;
+    const avgFrameTime = this.frameTimeSum / this.frameTimes.length;
     this.fps = Math.round(1000 / avgFrameTime);
     this.frameTime = avgFrameTime.toFixed(1);
   }